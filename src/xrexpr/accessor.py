@@ -20,7 +20,11 @@ is read off the base object rather than stored — the same derived-property dis
 See ``docs/internals/pipeline.md``.
 """
 
+import inspect
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
 from functools import wraps
+from types import FunctionType, MethodType
 from typing import Any
 
 import xarray as xr
@@ -78,6 +82,150 @@ _EAGER_ATTRS = frozenset(
     }
 )
 
+#: Whether a name the base object's *type* defines is callable, keyed by ``(type, name)``.
+#: Filled lazily by :meth:`LazyProxy._is_method_callable_on_base`, so every recorded call
+#: after the first of its name skips the probe. Only type-level names are cached: the
+#: others reach an instance's variables and attrs (``ds.temperature``), which differ per
+#: object and so have no verdict to share.
+_CALLABLE_ON_TYPE: dict[tuple[type, str], bool] = {}
+
+#: The plain function a replayed call resolves to, keyed by ``(type, name)``, or ``None``
+#: when the name is anything else on that type (an accessor, a ``staticmethod``, an
+#: instance attribute), or when the type is not one of xarray's own. Filled lazily by
+#: :func:`_plain_method`; keyed on the type actually reached at each step, since a
+#: chain's receiver changes type (``Dataset`` → ``DatasetGroupBy`` → ``Dataset``, or
+#: ``Dataset`` → ``DataArray``).
+_PLAIN_METHODS: dict[tuple[type, str], FunctionType | None] = {}
+
+
+def _plain_method(cls: type, name: str) -> FunctionType | None:
+    """Find the function ``cls`` defines for ``name``, if it is an ordinary method.
+
+    Parameters
+    ----------
+    cls : type
+        The receiver's type at this step of the replay.
+    name : str
+        The method being replayed.
+
+    Returns
+    -------
+    FunctionType or None
+        The function to call with the receiver as its first argument, or ``None`` when
+        the name must go through ``getattr`` on the instance after all.
+
+    Notes
+    -----
+    Resolved with ``inspect.getattr_static`` rather than ``getattr(cls, name)``, which
+    would unwrap a ``staticmethod`` into a function that must *not* be handed the
+    receiver. Only for a class xarray itself defines: those are slotted, so no instance
+    ``__dict__`` can shadow what the type defines, and calling the function with the
+    receiver is exactly what the bound method would have done. Anything else — what a
+    ``pipe(...)`` returns, or a user subclass of ``Dataset`` that xarray merely warns
+    about for lacking ``__slots__`` — may carry an instance attribute of the same name,
+    so it keeps the ``getattr`` that eager code would use.
+    """
+    key = (cls, name)
+    if key not in _PLAIN_METHODS:
+        found = inspect.getattr_static(cls, name, None)
+        slotted = cls.__module__.startswith("xarray.")
+        _PLAIN_METHODS[key] = (
+            found if slotted and isinstance(found, FunctionType) else None
+        )
+    return _PLAIN_METHODS[key]
+
+
+#: The recording function for each method a base type defines, keyed by ``(type, name)``,
+#: already carrying that method's name, docstring and signature. Filled lazily by
+#: :func:`_recorder`, so ``functools.wraps`` runs once per method rather than once per
+#: proxy — and a chain records every call on a *new* proxy.
+_RECORDERS: dict[tuple[type, str], Callable[..., Any]] = {}
+
+
+def _recorder(cls: type, name: str) -> Callable[..., Any]:
+    """Return the function that records a call to ``cls.name`` on the proxy it is bound to.
+
+    Parameters
+    ----------
+    cls : type
+        The base object's type, which defines ``name``.
+    name : str
+        The method being recorded.
+
+    Returns
+    -------
+    callable
+        ``(proxy, *args, **kwargs) -> LazyProxy``, wrapped to look like ``cls.name``.
+        :meth:`LazyProxy.__getattr__` binds it to the proxy with ``MethodType``, a C-level
+        bind, and the bound method forwards ``__doc__``/``__wrapped__`` to it, so
+        ``help(ds.plan.mean)`` still reads as ``Dataset.mean``.
+    """
+    key = (cls, name)
+    if key not in _RECORDERS:
+
+        @wraps(getattr(cls, name))
+        def record(proxy: LazyProxy, *args: Any, **kwargs: Any) -> LazyProxy:
+            return proxy._record(name, *args, **kwargs)
+
+        _RECORDERS[key] = record
+    return _RECORDERS[key]
+
+
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
+class _Recorded:
+    """One recorded call, linked to the calls recorded before it.
+
+    Attributes
+    ----------
+    prev : _Recorded or None
+        The call before this one, or ``None`` for the first.
+    node : FluentOp
+        This call, classified.
+    dataset_valued : bool
+        Whether every node up to and including this one is known to map a ``Dataset``
+        to a ``Dataset`` — see :meth:`LazyProxy._getitem_is_projection`.
+
+    Notes
+    -----
+    A persistent cons list, so that recording a call *shares* the plan before it instead
+    of copying it: a chain of N calls built one call at a time allocates N cells, where
+    ``ops + [node]`` allocated N lists of average length N/2. Branching is free — two
+    calls recorded on one proxy are two cells with the same ``prev``, and neither can see
+    the other.
+
+    ``dataset_valued`` is folded forward one cell at a time for the same reason, so the
+    one question recording asks of the whole plan costs a field read rather than a scan.
+    ``eq=False``/``repr=False``: the generated ones would recurse down the whole chain,
+    and a cell is compared by identity anyway.
+    """
+
+    prev: "_Recorded | None"
+    node: FluentOp
+    dataset_valued: bool
+
+
+def _link(prev: _Recorded | None, node: FluentOp) -> _Recorded:
+    """Record ``node`` after ``prev``, folding the ``Dataset``-valued flag forward.
+
+    Parameters
+    ----------
+    prev : _Recorded or None
+        The chain so far.
+    node : FluentOp
+        The call being recorded.
+
+    Returns
+    -------
+    _Recorded
+        The extended chain.
+    """
+    keeps_dataset = not (
+        isinstance(node, Opaque) or (isinstance(node, Project) and node.single)
+    )
+    return _Recorded(
+        prev, node, (prev is None or prev.dataset_valued) and keeps_dataset
+    )
+
 
 @xr.register_dataset_accessor("plan")  # type: ignore[no-untyped-call]
 @xr.register_dataarray_accessor("plan")  # type: ignore[no-untyped-call]
@@ -89,9 +237,9 @@ class LazyProxy:
     base : xarray.Dataset or xarray.DataArray
         The object the plan runs against. xarray supplies it when the ``.plan``
         accessor is first reached.
-    ops : list of FluentOp, optional
-        The plan recorded so far. Empty for a fresh proxy; each recorded call passes
-        the extended list to a new proxy.
+    ops : iterable of FluentOp, optional
+        The plan recorded so far. Empty for a fresh proxy; a recorded call extends its
+        receiver's plan on a new proxy without copying it (see :class:`_Recorded`).
 
     Notes
     -----
@@ -118,10 +266,13 @@ class LazyProxy:
     """
 
     def __init__(
-        self, base: xr.Dataset | xr.DataArray, ops: list[FluentOp] | None = None
+        self, base: xr.Dataset | xr.DataArray, ops: Iterable[FluentOp] | None = None
     ):
         self._base = base
-        self._ops: list[FluentOp] = list(ops) if ops else []
+        self._tail: _Recorded | None = None
+        for node in ops or ():
+            self._tail = _link(self._tail, node)
+        self._plan: list[LoweredOp] | None = None
 
     def _record(self, method_name: str, *args: Any, **kwargs: Any) -> "LazyProxy":
         """Append one recorded call to the plan, returning a fresh proxy.
@@ -144,7 +295,27 @@ class LazyProxy:
             node = Opaque(name=method_name, args=args, kwargs=frozendict(kwargs))
         else:
             node = to_opnode(method_name, args, kwargs)
-        return LazyProxy(self._base, self._ops + [node])
+        child = LazyProxy(self._base)
+        child._tail = _link(self._tail, node)
+        return child
+
+    @property
+    def _ops(self) -> list[FluentOp]:
+        """The recorded plan, in call order, as a fresh list.
+
+        Returns
+        -------
+        list of FluentOp
+            One node per recorded call. Built by walking the chain, so read it once per
+            use rather than in a loop.
+        """
+        ops = []
+        cell = self._tail
+        while cell is not None:
+            ops.append(cell.node)
+            cell = cell.prev
+        ops.reverse()
+        return ops
 
     def _getitem_is_projection(self) -> bool:
         """Report whether a ``__getitem__`` recorded here selects *variables*.
@@ -204,10 +375,7 @@ class LazyProxy:
         """
         if self._in_context() or isinstance(self._base, xr.DataArray):
             return False
-        return not any(
-            isinstance(node, Opaque) or (isinstance(node, Project) and node.single)
-            for node in self._ops
-        )
+        return self._tail is None or self._tail.dataset_valued
 
     def _base_schema(self) -> SchemaState:
         """Snapshot the *base* object's schema, which is what the optimiser plans against.
@@ -247,8 +415,22 @@ class LazyProxy:
         bool
             ``True`` for a method to record, ``False`` for a property to evaluate
             eagerly.
+
+        Notes
+        -----
+        Asked once per recorded call, and the answer for a name the base's type defines
+        is a fact about the type, so it is read from ``_CALLABLE_ON_TYPE`` after the
+        first probe. The probe itself still goes through the *instance*: an accessor is a
+        class on the type and an object on the instance, and it is the object that
+        replay will call.
         """
-        return callable(getattr(self._base, name, None))
+        key = (type(self._base), name)
+        verdict = _CALLABLE_ON_TYPE.get(key)
+        if verdict is None:
+            verdict = callable(getattr(self._base, name, None))
+            if hasattr(key[0], name):
+                _CALLABLE_ON_TYPE[key] = verdict
+        return verdict
 
     def _in_context(self) -> bool:
         """Report whether the live object is a builder rather than a Dataset or DataArray.
@@ -270,7 +452,7 @@ class LazyProxy:
         so ops *after* a context are modelled again instead of every one of them being
         opaque forever.
         """
-        return bool(self._ops) and isinstance(self._ops[-1], ContextOpen)
+        return self._tail is not None and isinstance(self._tail.node, ContextOpen)
 
     def __repr__(self) -> str:
         ops_preview = " -> ".join(
@@ -343,9 +525,12 @@ class LazyProxy:
             return _context_method
 
         if self._is_method_callable_on_base(name):
+            if hasattr(type(self._base), name):
+                return MethodType(_recorder(type(self._base), name), self)
 
+            # callable on the instance alone, so nothing to share
             @wraps(getattr(self._base, name))
-            def _method(*args: Any, **kwargs: Any) -> "LazyProxy":
+            def _method(*args: Any, **kwargs: Any) -> LazyProxy:
                 return self._record(name, *args, **kwargs)
 
             return _method
@@ -380,7 +565,22 @@ class LazyProxy:
         turned back into calls (:func:`~xrexpr.lower.emit`) and replayed onto the base
         object, then materialised via xarray's own ``.compute()`` so dask-backed data is
         realised.
+
+        Nothing is memoised here: each ``collect()`` replays, and hands back a result no
+        other call shares, so editing one in place (``result["t"] += 1``) never reaches
+        what the proxy returns next, and a proxy you hold keeps no computed copy of its
+        result alive. What repeats between calls is the planning, and that is memoised
+        by :meth:`_optimized`. Whatever the last call returns is computed as-is: on a
+        dask-backed base, a chain ending in ``pipe(lambda a: a.data)`` hands back the
+        realised array, not an xarray object.
+
+        The bare accessor has nothing to lower or replay, so it computes the base
+        directly — still *computed*: a property read on a bare ``ds.plan`` returns what
+        it would on ``ds.compute()``, realised values included, not what ``ds`` holds
+        lazily.
         """
+        if self._tail is None:
+            return self._base.compute()
         return self._replay(emit(self._optimized())).compute()
 
     def _optimized(self) -> list[LoweredOp]:
@@ -389,12 +589,32 @@ class LazyProxy:
         Returns
         -------
         list of LoweredOp
-            What :meth:`collect` will emit and replay.
+            What :meth:`collect` will emit and replay. Shared between calls — read it,
+            don't edit it.
+
+        Notes
+        -----
+        Memoised per proxy, since its plan never changes — recording returns a *new*
+        proxy — so ``explain()`` followed by ``collect()``, or a second ``collect()``,
+        plans once; only the plan is kept, never the data it produces. The plan is drawn
+        against the base schema as it was when first planned: mutate the base in place
+        after that and a proxy you are *holding* still plans against the old schema,
+        while the same chain recorded afresh from ``ds.plan`` plans against the new one.
+        The bare accessor xarray caches on the base (``ds.plan is ds.plan``) is exempt,
+        having nothing recorded: it plans to the empty list without reading the base, and
+        keeps no memo. Not across proxies: a key built from the recorded payloads would
+        conflate ``isel(time=1)`` with ``isel(time=True)`` (equal, and equal-hashing, but
+        not the same index), and a plan is cheap next to a replay. A plan that raises is
+        not memoised, so it raises again.
         """
-        schema = self._base_schema()
-        # Both stages plan against the base schema; lowering needs only its dim names, to
-        # tell a dim grouper from a coordinate one (see ``lower._grouper_dims``).
-        return optimize(to_lower_ir(self._ops, schema.dim_names), schema)
+        if self._tail is None:
+            return []
+        if self._plan is None:
+            schema = self._base_schema()
+            # Both stages plan against the base schema; lowering needs only its dim names,
+            # to tell a dim grouper from a coordinate one (see ``lower._grouper_dims``).
+            self._plan = optimize(to_lower_ir(self._ops, schema.dim_names), schema)
+        return self._plan
 
     def compute(self) -> xr.Dataset | xr.DataArray:
         """Alias for :meth:`collect`, for xarray users who reach for ``.compute()``.
@@ -446,12 +666,17 @@ class LazyProxy:
         -----
         Takes calls rather than nodes, so it never needs to know what a node *means* —
         deciding that is :func:`~xrexpr.lower.emit`'s job, and this stays the short
-        ``getattr`` loop it was when every node was exactly one call.
+        ``getattr`` loop it was when every node was exactly one call. An ordinary method
+        of one of xarray's own types is called straight off :func:`_plain_method`'s
+        cache, skipping the bound-method build; anything else still goes through
+        ``getattr``.
         """
         obj: xr.Dataset | xr.DataArray = self._base
         for call in calls:
             if call.name == "__getitem__":
                 obj = obj[call.args[0]]
+            elif (method := _plain_method(type(obj), call.name)) is not None:
+                obj = method(obj, *call.args, **call.kwargs)
             else:
                 obj = getattr(obj, call.name)(*call.args, **call.kwargs)
         return obj
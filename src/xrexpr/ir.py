@@ -12,7 +12,9 @@ closes with ``assert_never``, so a new variant is a type error at every unhandle
 rather than a silent fallthrough. Dim sets are symbolic where the call is — a bare
 ``ds.mean()`` records :data:`ALL_DIMS`, a *sentinel*, distinct from ``None``, which means
 *unknown*. And a node is frozen unconditionally but hashable only when its payload is; an
-array payload raises, deliberately, because hashing it would mean computing it.
+array payload raises, deliberately, because hashing it would mean computing it. Nodes are
+slotted as well as frozen: a chain records one per call, and nothing needs to hang
+undeclared state on one.
 
 Only **unary** ops are modelled. Keep that linearity assumption named here rather than
 leaked into individual rules.
@@ -53,7 +55,7 @@ __all__ = [
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AllDims:
     """Sentinel: *every dim present at this point*, whatever they turn out to be.
 
@@ -79,7 +81,7 @@ ALL_DIMS: Final = AllDims()
 DimSet = frozenset[Hashable] | AllDims
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Reduce:
     """A dimension-destroying reduction (``mean``/``sum``/``std``/...).
 
@@ -117,7 +119,7 @@ class Reduce:
             object.__setattr__(self, "consumes", frozenset(self.consumes))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Select:
     """An ``isel``/``sel`` selection, described by its ``{dim: indexer}`` mapping.
 
@@ -132,6 +134,9 @@ class Select:
         The call's keyword arguments, verbatim.
     indexer : frozendict
         The ``{dim: indexer}`` mapping the optimiser reasons about.
+    consumes : frozenset of Hashable
+        The dims this select drops — the scalar-indexed ones (slices and sequences keep
+        theirs). Derived from ``indexer``, never passed.
 
     Notes
     -----
@@ -141,14 +146,20 @@ class Select:
     modelled variant regardless of whether the node was recorded or hand-built.
 
     ``consumes`` is a *derived* view of ``indexer`` (the scalar-indexed dims, which
-    drop) — a ``@property``, never a stored field — so a merged select cannot disagree
-    with itself the way a separately-accumulated ``consumes`` could.
+    drop), computed once by ``__post_init__`` and never passed (``init=False``), so a
+    merged select cannot disagree with itself the way a separately-accumulated
+    ``consumes`` could. It was a ``@property`` until the schema fold and the rechunk rule
+    took to reading it on every fixpoint pass; a node is immutable, so deriving it at
+    construction gives the same answer without rebuilding the set per read. Exactly the
+    arrangement of :attr:`Rechunk.uniform`, and for the same reason: a reading of another
+    field, not an independent fact.
     """
 
     name: Literal["isel", "sel"]  # closed set → Literal (rejects Select(name="mean"))
     args: tuple[Any, ...] = ()
     kwargs: frozendict[str, Any] = field(default_factory=frozendict)
     indexer: frozendict[Hashable, Indexer] = field(default_factory=frozendict)
+    consumes: frozenset[Hashable] = field(init=False, default=frozenset())
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "args", tuple(self.args))
@@ -163,20 +174,14 @@ class Select:
                 }
             ),
         )
-
-    @property
-    def consumes(self) -> frozenset[Hashable]:
-        """Dims this select drops — the scalar-indexed ones (slices/sequences keep theirs).
-
-        Returns
-        -------
-        frozenset of Hashable
-            The dropped dims, derived from :attr:`indexer` so the two cannot disagree.
-        """
-        return frozenset(d for d, v in self.indexer.items() if v.drops_dim)
+        object.__setattr__(
+            self,
+            "consumes",
+            frozenset(d for d, v in self.indexer.items() if v.drops_dim),
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Scan:
     """An order-significant scan (``cumsum``/``cumprod``/``diff``) — *keeps* its dim.
 
@@ -214,7 +219,7 @@ class Scan:
             object.__setattr__(self, "dims", frozenset(self.dims))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Elementwise:
     """A per-element op (``fillna``/``astype``/``round``/...) — keeps every dim, size and
     variable, and so commutes with any select or projection.
@@ -254,7 +259,7 @@ class Elementwise:
         object.__setattr__(self, "kwargs", frozendict(self.kwargs))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Project:
     """A variable projection — ``ds["tas"]`` or ``ds[["tas", "pr"]]``.
 
@@ -306,7 +311,7 @@ class Project:
         return bool(self.args) and not isinstance(self.args[0], list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Rechunk:
     """A ``chunk`` call: changes chunk topology only — never a dim, size or value.
 
@@ -391,7 +396,7 @@ class Rechunk:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Opaque:
     """Any op the optimiser doesn't model — replayed verbatim, never reordered.
 
@@ -414,7 +419,7 @@ class Opaque:
         object.__setattr__(self, "kwargs", frozendict(self.kwargs))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextOpen:
     """A builder-returning call — ``groupby``/``rolling``/``weighted``/... .
 
@@ -470,7 +475,7 @@ ContextOpenName = Literal[
 ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GroupedReduce:
     """A grouped aggregation — ``ds.groupby("time.month").mean()`` — as *one* node.
 
@@ -538,7 +543,7 @@ class GroupedReduce:
         object.__setattr__(self, "consumes", frozenset(self.consumes))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WindowedReduce:
     """A windowed aggregation — ``ds.rolling(time=5).mean()`` — as *one* node.
 
@@ -596,7 +601,7 @@ class WindowedReduce:
         object.__setattr__(self, "reduce_kwargs", frozendict(self.reduce_kwargs))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeightedReduce:
     """A weighted aggregation — ``ds.weighted(w).mean("time")`` — as *one* node.
 
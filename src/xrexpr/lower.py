@@ -60,7 +60,7 @@ _RESAMPLE_OPTION_KWARGS = frozenset(
 )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Call:
     """One xarray method invocation — the unit replay actually performs.
 
@@ -34,6 +34,7 @@ __all__ = [
     "ProjectSpec",
     "RechunkSpec",
     "ReduceSpec",
+    "SEPARABLE_REDUCTIONS",
     "ScanSpec",
     "SelectSpec",
     "spec",
@@ -51,6 +52,9 @@ class ReduceSpec:
         :class:`~xrexpr.ir.Reduce`.
     dim_arg : int
         Where this reduction's dim spec sits among its **positional** arguments.
+    separable : bool
+        Whether one call over several dims is *exactly* the same call applied one dim at
+        a time, so ``optimize.merge_adjacent_reduces`` may fold two into one.
 
     Notes
     -----
@@ -59,10 +63,18 @@ class ReduceSpec:
     positional as a dim spec is what made ``ds.reduce(np.mean, "time")`` record a
     nonsense ``consumes`` (#96). A field rather than a lookup in a second name-keyed
     table, so a signature this odd travels with the row that has it.
+
+    ``separable`` is the same kind of fact, and a field for the same reason. It holds for
+    ``max``/``min``/``any``/``all``, which are order-insensitive and idempotent, so
+    regrouping cannot move a value. ``sum``/``prod`` regroup a float reduction, which
+    reassociates it; ``mean``/``count``/``std``/``var``/``median`` of partial results is
+    not the reduction of the whole (a mean of means weights by the NaN pattern; a count
+    of counts counts counts). Defaults to ``False``, so a new row has to earn it.
     """
 
     name: str  # open set of reductions → str, as on ``ir.Reduce``
     dim_arg: int = 0
+    separable: bool = False
 
 
 @dataclass(frozen=True)
@@ -203,12 +215,10 @@ OpSpec = (
 )
 
 
+# Split by ``ReduceSpec.separable``: the first four fold across adjacent calls.
+_SEPARABLE = ("all", "any", "max", "min")
 _REDUCTIONS = (
     "count",
-    "all",
-    "any",
-    "max",
-    "min",
     "mean",
     "prod",
     "sum",
@@ -229,6 +239,7 @@ _CONTEXTS: tuple[ContextOpenName, ...] = get_args(ContextOpenName)
 _ELEMENTWISE = ("fillna", "astype", "round", "clip", "isnull", "notnull")
 
 _SPECS: tuple[OpSpec, ...] = (
+    *(ReduceSpec(name, separable=True) for name in _SEPARABLE),
     *(ReduceSpec(name) for name in _REDUCTIONS),
     ReduceSpec("reduce", dim_arg=1),  # ``reduce(func, dim, ...)`` — see ReduceSpec
     ScanSpec("cumsum"),
@@ -254,6 +265,13 @@ OP_TABLE: dict[str, OpSpec] = {op.name: op for op in _SPECS}
 #: no derivation can supply.
 CONTEXT_METHODS = frozenset(op.name for op in _SPECS if isinstance(op, ContextSpec))
 
+#: The reductions ``optimize.merge_adjacent_reduces`` may fold, as a set. Derived from
+#: :attr:`ReduceSpec.separable` for the same reason :data:`CONTEXT_METHODS` is derived:
+#: the rule's membership test then cannot disagree with the rows.
+SEPARABLE_REDUCTIONS = frozenset(
+    op.name for op in _SPECS if isinstance(op, ReduceSpec) and op.separable
+)
+
 
 def spec(name: str) -> OpSpec | None:
     """Look up the :data:`OpSpec` for a method name.
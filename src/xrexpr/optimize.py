@@ -23,8 +23,10 @@ See ``docs/internals/optimiser.md``.
 
 from collections.abc import Callable, Hashable, Iterable, Mapping
 from dataclasses import dataclass
-from typing import Literal, TypeGuard
+from itertools import groupby
+from typing import Any, Literal, TypeGuard
 
+import xarray as xr
 from frozendict import frozendict
 from typing_extensions import assert_never
 
@@ -64,6 +66,7 @@ from xrexpr.ir import (
     WeightedReduce,
     WindowedReduce,
 )
+from xrexpr.operations import SEPARABLE_REDUCTIONS
 from xrexpr.schema import SchemaState, apply_schema, resolve_dims
 
 __all__ = ["optimize"]
@@ -115,8 +118,18 @@ def optimize(nodes: Plan, schema: SchemaState) -> Plan:
     no rule may ever push a node *right* or lengthen a plan — the invariant a new rule
     has to preserve. (The pushdown rules fire on disjoint adjacencies — ``(*, select)``,
     ``(*, project)`` and ``(rechunk, select)`` — so they can't undo one another.)
+
+    Every rule looks at two nodes or more, so a plan shorter than that is returned as it
+    came, without a pass. So is a plan holding none of :data:`_REWRITABLE` — every rule
+    moves or folds one of those kinds, so on a plan of scans, fused reduces and opaque
+    calls the first pass would only confirm the fixpoint, and one ``isinstance`` scan
+    says the same. Nor is the input copied: no rule mutates the plan it is given (each
+    builds the plan it returns), so a plan no rule rewrites comes back as the very list
+    passed in.
     """
-    plan = list(nodes)
+    if len(nodes) < 2 or not any(isinstance(node, _REWRITABLE) for node in nodes):
+        return nodes
+    plan = nodes
     while True:
         changed = False
         for rule in _RULES:
@@ -127,6 +140,14 @@ def optimize(nodes: Plan, schema: SchemaState) -> Plan:
             return plan
 
 
+#: The node kinds some rule moves or folds: selects (merged, and hopped past reduces and
+#: rechunks), projections (merged and hopped) and plain reductions (merged). A rule only
+#: ever removes, merges or reorders nodes, so a plan without any of these never gains one
+#: and :func:`optimize` can return it without a pass. Extend this with the rule that
+#: needs it.
+_REWRITABLE = (Select, Project, Reduce)
+
+
 def _schemas(nodes: Plan, base: SchemaState) -> list[SchemaState]:
     """Fold the base schema forward through a plan.
 
@@ -196,7 +217,7 @@ class DimEffect:
     Notes
     -----
     A **derived** view, never stored: :func:`dim_effect` computes it from a node with one
-    ``match``, which is the house's "derive, don't store" discipline (``Select.consumes``,
+    ``match``, which is the house's "derive, don't pass" discipline (``Select.consumes``,
     ``Project.single``) applied one level up — at the plan rather than the node. One
     dispatch site instead of a partial match per rule, so every node kind answers both
     rules' questions in one place.
@@ -352,44 +373,121 @@ def merge_adjacent_selects(nodes: Plan, schema: SchemaState) -> Plan | None:
     a same-dim collision with no statically provable composition.
     """
     out: Plan = []
-    folded = False
-    i, n = 0, len(nodes)
-    while i < n:
-        node = nodes[i]
-        if not _mergeable_select(node):
-            out.append(node)
-            i += 1
+    for name, group in groupby(nodes, key=_select_run_key):
+        if name is None:
+            out.extend(group)
+        else:
+            # every node in a keyed run is a select; the filter only narrows the type
+            out.extend(_fold_run(name, [n for n in group if isinstance(n, Select)]))
+    return out if len(out) < len(nodes) else None
+
+
+def _select_run_key(node: LoweredOp) -> str | None:
+    """Group key for :func:`merge_adjacent_selects`: the select kind, or ``None``.
+
+    Parameters
+    ----------
+    node : LoweredOp
+        The candidate node.
+
+    Returns
+    -------
+    str or None
+        ``"isel"``/``"sel"`` for a :func:`_mergeable_select`, so a run of them shares a
+        key and a change of kind starts a new run; ``None`` for everything else, which is
+        passed through.
+    """
+    return node.name if _mergeable_select(node) else None
+
+
+def _fold_run(name: str, run: list[Select]) -> list[Select]:
+    """Fold a run of same-kind mergeable selects, left to right.
+
+    Parameters
+    ----------
+    name : str
+        The run's select kind.
+    run : list of Select
+        The run, in plan order.
+
+    Returns
+    -------
+    list of Select
+        One node per stretch that composed. A collision ``_compose_into`` can't prove
+        ends a stretch and starts the next at the node that collided, so an uncomposable
+        run degrades to several correct nodes rather than one wrong one. A stretch of one
+        keeps its original node, header and all.
+    """
+    out: list[Select] = []
+    head, indexer, count = run[0], dict(run[0].indexer), 1
+    for node in run[1:]:
+        merged = _compose_into(name, indexer, node.indexer)
+        if merged is not None:
+            indexer, count = merged, count + 1
             continue
+        out.append(_folded_select(head, indexer, count))
+        head, indexer, count = node, dict(node.indexer), 1
+    out.append(_folded_select(head, indexer, count))
+    return out
 
-        j = i + 1
-        indexer = dict(node.indexer)
-        # ``consumes`` is not accumulated here — it is a derived property of the
-        # merged ``indexer`` on :class:`~xrexpr.ir.Select`, so it cannot drift from it.
-        # ``args`` does mirror ``indexer`` and is
-        # rebuilt from it below, which stays the merge rule's local responsibility.
-        while j < n:
-            nxt = nodes[j]
-            if nxt.name != node.name or not _mergeable_select(nxt):
-                break
-            merged = _compose_into(node.name, indexer, nxt.indexer)
-            if merged is None:  # a dim we can't compose — end the run here
-                break
-            indexer = merged
-            j += 1
-
-        if j - i > 1:  # at least two selects folded
-            folded = True
-            out.append(
-                Select(
-                    name=node.name,
-                    args=({dim: v.to_raw() for dim, v in indexer.items()},),
-                    indexer=frozendict(indexer),
-                )
-            )
-        else:
-            out.append(node)
-        i = j
-    return out if folded else None
+
+def _folded_select(
+    head: Select, indexer: dict[Hashable, Indexer], count: int
+) -> Select:
+    """Build the node a stretch of ``count`` selects starting at ``head`` folds to.
+
+    Parameters
+    ----------
+    head : Select
+        The stretch's first select.
+    indexer : dict
+        The composed indexer of the whole stretch.
+    count : int
+        How many selects the stretch holds.
+
+    Returns
+    -------
+    Select
+        ``head`` itself for a stretch of one; otherwise a fresh select whose ``args``
+        mirror ``indexer``. ``consumes`` is not accumulated — it is derived from the
+        merged ``indexer`` on :class:`~xrexpr.ir.Select`, so it cannot drift from it.
+    """
+    if count == 1:
+        return head
+    return Select(
+        name=head.name,
+        args=_positional_header(indexer),
+        indexer=frozendict(indexer),
+    )
+
+
+def _positional_header(
+    spec: Mapping[Hashable, Indexer | ChunkSpec],
+) -> tuple[dict[Hashable, Any]]:
+    """Build the ``args`` a rebuilt select or rechunk replays with.
+
+    Parameters
+    ----------
+    spec : Mapping
+        The node's normalised ``{dim: value}`` mapping — a select's indexers or a
+        rechunk's chunk specs.
+
+    Returns
+    -------
+    tuple of dict
+        A one-element ``args`` tuple holding the raw ``{dim: value}`` dict, so the node
+        emits as ``isel({...})`` / ``chunk({...})``.
+
+    Notes
+    -----
+    The one place a rule decides how a node it *built* will replay; a recorded node keeps
+    its verbatim header. The positional-dict form rather than kwargs because a dim is any
+    ``Hashable``, not necessarily an identifier or even a ``str``, and only a dict can
+    carry it — and because it is the form xarray reads directly, with no kwargs to fold
+    in first. Through the public method, deliberately: xarray's private indexing helpers
+    would save a little more and break on its next refactor.
+    """
+    return ({dim: value.to_raw() for dim, value in spec.items()},)
 
 
 def _mergeable_select(node: LoweredOp) -> TypeGuard[Select]:
@@ -452,7 +550,7 @@ def _compose_into(
     since a half-applied ``inner`` would be neither select.
     """
     if name != "isel":  # ``sel`` composition needs coordinate values; positions only
-        return None if set(outer) & set(inner) else {**outer, **inner}
+        return {**outer, **inner} if outer.keys().isdisjoint(inner) else None
 
     merged = dict(outer)
     for dim, index in inner.items():
@@ -705,6 +803,197 @@ def _scaled_stop(inner_stop: int | None, start: int, step: int) -> int | None:
     return None if inner_stop is None else start + inner_stop * step
 
 
+def merge_interleaved_selects(nodes: Plan, schema: SchemaState) -> Plan | None:
+    """Fold ``[sel, isel, sel]`` into ``[sel, isel]`` when the last select commutes back.
+
+    Parameters
+    ----------
+    nodes : Plan
+        The plan to rewrite.
+    schema : SchemaState
+        The schema of the dataset the plan starts from. Read only for its dim names — see
+        the notes.
+
+    Returns
+    -------
+    Plan or None
+        The plan with one interleaved triple folded, or ``None`` when none folds.
+
+    Notes
+    -----
+    :func:`merge_adjacent_selects` stops at a change of kind, because an ``isel`` and a
+    ``sel`` index differently and cannot share one indexer. So
+    ``ds.sel(lat=1).isel(time=0).sel(lon=2)`` keeps three calls, although the outer two
+    could be one: selects on **disjoint** dims commute whatever their kind, each acting
+    independently at every position of the other's dims. Hopping the trailing select one
+    place left makes it adjacent to its twin, and the two fold by ``_compose_into`` exactly
+    as an adjacent run would — ``[sel(lat=1, lon=2), isel(time=0)]``.
+
+    The hop is only taken when the fold follows, and that is what keeps the termination
+    measure honest: swapping two selects leaves the index sum where it was, so a bare swap
+    rule could flip an ``(isel, sel)`` pair back and forth forever. Paired with the fold,
+    the plan shrinks.
+
+    Guards, each a reason to leave the triple alone:
+
+    - **every node a bare select** (``_mergeable_select``). A ``drop=True`` in the middle
+      changes which coordinates survive the scalar dims, and moving a select across it is
+      not something this rule proves anything about;
+    - **the hopping select's dims disjoint from the middle one's.** Anything shared means
+      the two address the same axis and their order is the meaning;
+    - **no array-valued indexer in the triple.** A ``DataArray``/``Variable`` indexer is
+      *vectorized*: it indexes along its own dims, which may be another select's key, so
+      disjoint key sets are not disjoint axes.
+      ``sel(lat=1).isel(time=DataArray([...], dims="lon")).sel(lon=slice(1, 3))`` has
+      the ``isel`` mint a fresh ``lon`` the last ``sel`` then slices — hopped, it would
+      slice the original ``lon`` first. ``classify`` files such a value as a ``Scalar``,
+      so the indexer variant cannot tell; the raw value has to be asked;
+    - **the triple inside the trusted prefix, and every key of the two that swap a dim of
+      the base dataset.** A ``sel`` key may name a ``MultiIndex`` *level* rather than a
+      dim, and then disjoint names are not disjoint axes. The base's dim names speak for
+      the triple only while no :class:`~xrexpr.ir.Opaque` precedes it: after
+      ``rename(lat="q").stack(lat=("q", "lon"))`` the name ``lat`` is a new stacked dim
+      and ``lon`` one of its levels, though both are dims of the base. Inside the prefix
+      every modelled node keeps, drops or mints dims but never repurposes a name, so a
+      base dim is still that dim or gone (and a select on a gone dim raises either way);
+    - **the outer pair composes.** ``None`` from ``_compose_into`` (a same-dim ``sel``, an
+      uncomposable ``isel`` collision) leaves three correct nodes.
+
+    One fold per call; :func:`optimize`'s fixpoint handles the rest.
+    """
+    for i in range(_trusted_prefix(nodes) - 2):
+        first, middle, last = nodes[i], nodes[i + 1], nodes[i + 2]
+        if not (
+            _mergeable_select(first)
+            and _mergeable_select(middle)
+            and _mergeable_select(last)
+        ):
+            continue
+        if first.name != last.name or middle.name == first.name:
+            continue
+        if not middle.indexer.keys().isdisjoint(last.indexer):
+            continue
+        if _vectorized(first) or _vectorized(middle) or _vectorized(last):
+            continue
+        if not schema.dim_names.issuperset((*middle.indexer, *last.indexer)):
+            continue
+
+        merged = _compose_into(first.name, dict(first.indexer), last.indexer)
+        if merged is None:
+            continue
+        folded = Select(
+            name=first.name,
+            args=_positional_header(merged),
+            indexer=frozendict(merged),
+        )
+        return list(nodes[:i]) + [folded, middle] + list(nodes[i + 3 :])
+    return None
+
+
+def _vectorized(node: Select) -> bool:
+    """Report whether any of a select's indexers is array-valued.
+
+    Parameters
+    ----------
+    node : Select
+        The select to inspect.
+
+    Returns
+    -------
+    bool
+        ``True`` when some indexer is an ``xr.DataArray`` or ``xr.Variable``, whose own
+        dims — not the key it is filed under — decide which axes it touches.
+    """
+    return any(
+        isinstance(v.to_raw(), (xr.DataArray, xr.Variable))
+        for v in node.indexer.values()
+    )
+
+
+def merge_adjacent_reduces(nodes: Plan, schema: SchemaState) -> Plan | None:
+    """Fold two adjacent same-name reductions over disjoint dims into one call.
+
+    Parameters
+    ----------
+    nodes : Plan
+        The plan to rewrite.
+    schema : SchemaState
+        The schema entering the plan. Unused — this is a dim-level rule.
+
+    Returns
+    -------
+    Plan or None
+        The plan with one pair of reductions folded, or ``None`` when no pair folds.
+
+    Notes
+    -----
+    ``ds.max("lat").max("lon")`` makes xarray dispatch twice and build an intermediate
+    dataset that is thrown away a call later; ``ds.max(dim=["lat", "lon"])`` is one call
+    with the same answer. The folded node is rebuilt with a ``dim=`` list, sorted by
+    ``str`` for the same reason ``schema._minted`` sorts — a set has no order to keep,
+    and the result's dim order does not depend on the list's.
+
+    Only :data:`~xrexpr.operations.SEPARABLE_REDUCTIONS` fold: the rewrite must not move a
+    value, and for the rest it would — see
+    :attr:`~xrexpr.operations.ReduceSpec.separable`. The coordinates agree either way,
+    since a reduce drops every coordinate spanning a dim it removes, one call or two.
+
+    Three guards, each a reason to leave the pair alone:
+
+    - **both dim sets concrete and disjoint.** ``ALL_DIMS`` on either side leaves nothing
+      named to merge, and a shared dim makes the second call raise eagerly, which a fold
+      would silence;
+    - **identical options.** ``skipna``/``keep_attrs`` are per call, and a merged call can
+      carry only one of each;
+    - **the dim spec where ``to_opnode`` read it.** Anything past the first positional is
+      a header this rule cannot rebuild faithfully, so it stays verbatim.
+
+    One fold per call; :func:`optimize`'s fixpoint collapses a run of three. The rule
+    shrinks the plan, so the termination measure is satisfied on its first component.
+    """
+    for i in range(len(nodes) - 1):
+        first, second = nodes[i], nodes[i + 1]
+        if not (isinstance(first, Reduce) and isinstance(second, Reduce)):
+            continue
+        if first.name != second.name or first.name not in SEPARABLE_REDUCTIONS:
+            continue
+        if isinstance(first.consumes, AllDims) or isinstance(second.consumes, AllDims):
+            continue
+        if not first.consumes.isdisjoint(second.consumes):
+            continue
+        options = _reduce_options(first)
+        if options is None or options != _reduce_options(second):
+            continue
+
+        dims = first.consumes | second.consumes
+        folded = Reduce(
+            name=first.name,
+            kwargs=frozendict({**options, "dim": sorted(dims, key=str)}),
+            consumes=dims,
+        )
+        return list(nodes[:i]) + [folded] + list(nodes[i + 2 :])
+    return None
+
+
+def _reduce_options(node: Reduce) -> dict[str, object] | None:
+    """Return a reduction's keyword options — everything but its dim spec.
+
+    Parameters
+    ----------
+    node : Reduce
+        The reduction to read.
+
+    Returns
+    -------
+    dict or None
+        The kwargs minus ``dim``, or ``None`` when the header carries anything else
+        positionally, or names its dim twice, which the caller reads as a refusal.
+    """
+    if len(node.args) > 1 or (node.args and "dim" in node.kwargs):
+        return None
+    return {k: v for k, v in node.kwargs.items() if k != "dim"}
+
+
 def merge_adjacent_projects(nodes: Plan, schema: SchemaState) -> Plan | None:
     """Drop the first of an adjacent pair of projections when the second subsumes it.
 
@@ -780,11 +1069,11 @@ def merge_adjacent_projects(nodes: Plan, schema: SchemaState) -> Plan | None:
     shrinks the plan, so the termination measure is satisfied on its first component.
     """
     for i in range(len(nodes) - 1):
-        match nodes[i], nodes[i + 1]:
-            case (Project() as first, Project() as second) if not first.single and set(
-                second.variables
-            ) <= set(first.variables):
-                return list(nodes[:i]) + list(nodes[i + 1 :])
+        first, second = nodes[i], nodes[i + 1]
+        if not (isinstance(first, Project) and isinstance(second, Project)):
+            continue
+        if not first.single and set(first.variables).issuperset(second.variables):
+            return list(nodes[:i]) + list(nodes[i + 1 :])
     return None
 
 
@@ -802,7 +1091,8 @@ def pushdown_selects(nodes: Plan, schema: SchemaState) -> Plan | None:
     Returns
     -------
     Plan or None
-        The plan with one select moved one hop left, or ``None`` when no adjacency swaps.
+        The plan with one select moved as far left as it can go, or ``None`` when no
+        adjacency swaps.
 
     Raises
     ------
@@ -842,34 +1132,74 @@ def pushdown_selects(nodes: Plan, schema: SchemaState) -> Plan | None:
     ``ALL_DIMS`` needs no schema: whatever the dims turn out to be, a reduce over every one
     of them leaves nothing for a select to index, so every select dim overlaps.
 
-    One hop per call. :func:`optimize`'s fixpoint composes hops so a select reaches the
-    front of a run of reductions (and adjacent selects then merge).
+    One select per call, walked as far left as it goes: past a run of five reductions
+    that is one call and one splice, where hopping once per call cost five fixpoint
+    passes — each re-running every rule over the whole plan — and five plan copies.
+    Whether each hop is allowed is decided exactly as before, one crossed node at a time
+    (:func:`_select_hops`), so the walk stops where the hops would have, and a select that
+    would have raised several passes later raises now instead. Adjacent selects merge on
+    the next pass.
     """
-    for i in range(len(nodes) - 1):
-        crossed, select = nodes[i], nodes[i + 1]
+    for i in range(1, len(nodes)):
+        select = nodes[i]
         if not isinstance(select, Select):
             continue
 
-        effect = dim_effect(crossed)
-        blocks = effect.blocks
-        if blocks is None:
-            continue
-
         select_dims = frozenset(select.indexer)
-        shared = select_dims if isinstance(blocks, AllDims) else select_dims & blocks
-        if not shared:
-            swapped = list(nodes)
-            swapped[i], swapped[i + 1] = select, crossed
-            return swapped
-
-        if effect.on_conflict == "invalid":
-            raise InvalidExpressionError(
-                f"{select.name}() indexes {sorted(str(d) for d in shared)}, "
-                f"which {crossed.name}() has already reduced away"
-            )
+        j = i
+        while j > 0 and _select_hops(nodes[j - 1], select, select_dims):
+            j -= 1
+        if j < i:
+            return list(nodes[:j]) + [select] + list(nodes[j:i]) + list(nodes[i + 1 :])
     return None
 
 
+def _select_hops(
+    crossed: LoweredOp, select: Select, select_dims: frozenset[Hashable]
+) -> bool:
+    """Decide whether a select may hop left over the node in front of it.
+
+    Parameters
+    ----------
+    crossed : LoweredOp
+        The node the select would cross.
+    select : Select
+        The select, for the error message.
+    select_dims : frozenset
+        The select's indexed dims, computed once per walk by the caller.
+
+    Returns
+    -------
+    bool
+        ``True`` when the dims are disjoint from what ``crossed`` blocks, ``False`` when
+        it refuses the hop or the overlap is merely ``"immovable"``.
+
+    Raises
+    ------
+    InvalidExpressionError
+        When the overlap is ``"invalid"`` — see :func:`pushdown_selects`.
+    """
+    effect = dim_effect(crossed)
+    blocks = effect.blocks
+    if blocks is None:
+        return False
+
+    # the common answer is "disjoint": settle it without building the intersection,
+    # which only the error message needs
+    if not isinstance(blocks, AllDims) and select_dims.isdisjoint(blocks):
+        return True
+    shared = select_dims if isinstance(blocks, AllDims) else select_dims & blocks
+    if not shared:  # an empty select against ``ALL_DIMS``
+        return True
+
+    if effect.on_conflict == "invalid":
+        raise InvalidExpressionError(
+            f"{select.name}() indexes {sorted(str(d) for d in shared)}, "
+            f"which {crossed.name}() has already reduced away"
+        )
+    return False
+
+
 def pushdown_projections(nodes: Plan, schema: SchemaState) -> Plan | None:
     """Hop a variable projection left past a preceding reduce, select or fused reduce.
 
@@ -885,7 +1215,8 @@ def pushdown_projections(nodes: Plan, schema: SchemaState) -> Plan | None:
     Returns
     -------
     Plan or None
-        The plan with one projection moved one hop left, or ``None`` when nothing moves.
+        The plan with one projection moved as far left as it can go, or ``None`` when
+        nothing moves.
 
     Notes
     -----
@@ -955,38 +1286,59 @@ def pushdown_projections(nodes: Plan, schema: SchemaState) -> Plan | None:
     (278 of them hopped) changed no value, no coordinate and raised nothing new; the 36
     that skipped an error each returned exactly the projection-first answer.
 
-    One hop per call. :func:`optimize`'s fixpoint composes hops so a projection walks to
-    the front of the plan (where issue #43 wants to eventually turn it into a backend
-    read plan).
+    One projection per call, walked as far left as it goes — to the front of the plan when
+    nothing stops it (where issue #43 wants to eventually turn it into a backend read
+    plan). The walk reuses one schema fold: a hop changes only the nodes *after* the
+    projection's new position, so the schema entering every node before it — all the
+    walk ever consults — is what ``schemas`` already holds. Hopping once per call re-ran
+    every rule and re-folded the schema per hop.
     """
     if not any(isinstance(node, Project) for node in nodes):
         return None  # nothing to move: don't fold the schema for a projection-free plan
 
     limit = _trusted_prefix(nodes)
     schemas = _schemas(nodes[:limit], schema)
-    for i in range(limit - 1):
-        project = nodes[i + 1]
+    for i in range(1, limit):
+        project = nodes[i]
         if not isinstance(project, Project):
             continue
 
-        crossed = nodes[i]
-        requires = dim_effect(crossed).requires
-        if requires is None:  # don't know what it needs, so don't move anything past it
-            continue
+        j = i
+        while j > 0 and _project_hops(nodes[j - 1], project, schemas[j - 1]):
+            j -= 1
+        if j < i:
+            return list(nodes[:j]) + [project] + list(nodes[j:i]) + list(nodes[i + 1 :])
+    return None
 
-        # ``ALL_DIMS`` (a bare ``mean()``) resolves against the schema *entering* the
-        # crossed node, which is exact here because this loop stays inside the trusted
-        # prefix. The subset test below then passes only when the projected variables span
-        # every dim — exactly when the replayed bare reduce reduces the same ones.
-        needed = resolve_dims(requires, schemas[i].dim_names)
-        available = schemas[i].var_dims(project.variables)
-        if available is None or not needed <= available:
-            continue
 
-        swapped = list(nodes)
-        swapped[i], swapped[i + 1] = project, crossed
-        return swapped
-    return None
+def _project_hops(crossed: LoweredOp, project: Project, entering: SchemaState) -> bool:
+    """Decide whether a projection may hop left over the node in front of it.
+
+    Parameters
+    ----------
+    crossed : LoweredOp
+        The node the projection would cross.
+    project : Project
+        The projection.
+    entering : SchemaState
+        The schema entering ``crossed`` — exact, since the caller stays inside the
+        trusted prefix.
+
+    Returns
+    -------
+    bool
+        ``True`` when the projected variables carry every dim ``crossed`` requires.
+    """
+    requires = dim_effect(crossed).requires
+    if requires is None:  # don't know what it needs, so don't move anything past it
+        return False
+
+    # ``ALL_DIMS`` (a bare ``mean()``) resolves against the schema *entering* the crossed
+    # node. The subset test below then passes only when the projected variables span
+    # every dim — exactly when the replayed bare reduce reduces the same ones.
+    needed = resolve_dims(requires, entering.dim_names)
+    available = entering.var_dims(project.variables)
+    return available is not None and needed <= available
 
 
 def pushdown_selects_past_rechunks(nodes: Plan, schema: SchemaState) -> Plan | None:
@@ -1042,29 +1394,30 @@ def pushdown_selects_past_rechunks(nodes: Plan, schema: SchemaState) -> Plan | N
     unreplayable, only slower. One hop per call.
     """
     for i in range(len(nodes) - 1):
-        match nodes[i], nodes[i + 1]:
-            case (Rechunk() as rechunk, Select() as select) if _pushable_rechunk(
-                rechunk
-            ):
-                kept = {
-                    dim: spec
-                    for dim, spec in rechunk.chunks.items()
-                    if dim not in select.consumes
-                }
-                if len(kept) == len(rechunk.chunks):  # nothing named was dropped
-                    moved: Plan = [select, rechunk]
-                elif kept:
-                    moved = [
-                        select,
-                        Rechunk(
-                            name=rechunk.name,
-                            args=({dim: s.to_raw() for dim, s in kept.items()},),
-                            chunks=frozendict(kept),
-                        ),
-                    ]
-                else:  # the spec is spent
-                    moved = [select]
-                return list(nodes[:i]) + moved + list(nodes[i + 2 :])
+        rechunk, select = nodes[i], nodes[i + 1]
+        if not (isinstance(rechunk, Rechunk) and isinstance(select, Select)):
+            continue
+        if not _pushable_rechunk(rechunk):
+            continue
+        kept = {
+            dim: spec
+            for dim, spec in rechunk.chunks.items()
+            if dim not in select.consumes
+        }
+        if len(kept) == len(rechunk.chunks):  # nothing named was dropped
+            moved: Plan = [select, rechunk]
+        elif kept:
+            moved = [
+                select,
+                Rechunk(
+                    name=rechunk.name,
+                    args=_positional_header(kept),
+                    chunks=frozendict(kept),
+                ),
+            ]
+        else:  # the spec is spent
+            moved = [select]
+        return list(nodes[:i]) + moved + list(nodes[i + 2 :])
     return None
 
 
@@ -1141,6 +1494,8 @@ def _pushable_rechunk(node: Rechunk) -> bool:
 
 _RULES: tuple[Rule, ...] = (
     merge_adjacent_selects,
+    merge_interleaved_selects,
+    merge_adjacent_reduces,
     merge_adjacent_projects,
     pushdown_selects,
     pushdown_projections,
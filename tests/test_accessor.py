@@ -7,7 +7,9 @@ in ``tests/test_optimize.py`` (it owns ``optimize``); here we only care that the
 accessor records the right nodes and that the pipeline replays to the right result.
 """
 
+import gc
 import importlib.util
+import weakref
 
 import numpy as np
 import pandas as pd
@@ -17,8 +19,9 @@ from frozendict import frozendict
 from xarray.testing import assert_equal
 
 import xrexpr  # noqa: F401 -- registers the ``.plan`` accessor
-from xrexpr.accessor import _EAGER_ATTRS, Explanation, LazyProxy
+from xrexpr.accessor import _EAGER_ATTRS, Explanation, LazyProxy, _plain_method
 from xrexpr.exceptions import InvalidExpressionError
+from xrexpr.indexers import classify
 from xrexpr.ir import (
     ALL_DIMS,
     ContextOpen,
@@ -114,6 +117,117 @@ def test_getattr_property_materialises(ds):
     assert dict(ds.plan.sizes) == dict(ds.sizes)
 
 
+def test_a_chain_s_proxies_are_freed_without_the_cycle_collector(ds):
+    """A method is bound afresh on each lookup, so no proxy it was looked up on refers back to itself."""
+    gc.disable()
+    try:
+        stem = ds.plan.isel(time=0)
+        grouped = stem.groupby("lon")  # ``.mean`` on it is recorded in a context
+        grouped.mean().rename({"lat": "y"})
+        alive = [weakref.ref(stem), weakref.ref(grouped)]
+        del stem, grouped
+        assert [ref() for ref in alive] == [None, None]
+    finally:
+        gc.enable()
+
+
+def test_collect_results_share_nothing_with_the_proxy(ds):
+    """Editing one ``collect()`` result in place never changes what the proxy returns next."""
+    proxy = ds.plan.mean("lat")
+    first = proxy.collect()
+    first["temperature"] += 100
+    first.attrs["touched"] = True
+    again = proxy.collect()
+    assert_equal(again, ds.mean("lat"))
+    assert "touched" not in again.attrs
+
+
+def test_collect_returns_whatever_the_chain_ends_in(ds):
+    """A ``pipe`` that leaves xarray hands back its computed value, here a numpy array."""
+    result = ds.chunk().plan["temperature"].pipe(lambda a: a.data).collect()
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_array_equal(result, ds["temperature"].values)
+
+
+def test_explain_then_collect_plans_once(ds):
+    """``explain()`` and ``collect()`` on one proxy share a single optimisation."""
+    proxy = ds.plan.mean("lat").isel(time=0)
+    assert proxy._optimized() is proxy._optimized()
+    proxy.explain()
+    assert_equal(proxy.collect(), ds.mean("lat").isel(time=0))
+
+
+def test_replay_resolves_only_ordinary_methods_off_the_type():
+    """Plain methods resolve to their function; accessors and unknown names fall back to ``getattr``."""
+    assert _plain_method(xr.Dataset, "mean") is xr.Dataset.mean
+    assert _plain_method(xr.Dataset, "plot") is None
+    assert _plain_method(xr.Dataset, "temperature") is None
+
+
+@pytest.mark.filterwarnings("ignore:.*__slots__:FutureWarning")
+def test_replay_defers_to_an_instance_attribute_on_a_foreign_type(ds):
+    """A slot-less subclass can shadow a method per instance, so its calls go through ``getattr``."""
+
+    class Unslotted(xr.Dataset):
+        pass
+
+    def _shadowed(d):
+        obj = Unslotted(d.data_vars)
+        obj.mean = lambda *args, **kwargs: "shadowed"
+        return obj
+
+    assert _plain_method(Unslotted, "mean") is None
+    proxy = ds.plan.pipe(_shadowed).mean("lat")
+    assert proxy._replay(emit(proxy._optimized())) == "shadowed"
+
+
+def test_an_empty_plan_collects_without_planning(ds, monkeypatch):
+    """A bare ``ds.plan`` computes the base directly; the planner is never reached."""
+
+    def _unreachable(self):
+        raise AssertionError("an empty plan should not be planned")
+
+    monkeypatch.setattr(LazyProxy, "_optimized", _unreachable)
+    assert_equal(ds.plan.collect(), ds.compute())
+    assert ds.plan.sizes == ds.sizes
+
+
+def test_recording_shares_the_prefix_and_branches_independently(ds):
+    """Two calls recorded on one proxy extend the same chain without copying or seeing each other."""
+    stem = ds.plan.mean("lat")
+    left, right = stem.isel(time=0), stem.isel(time=1)
+    assert left._tail.prev is stem._tail is right._tail.prev
+    assert [n.name for n in stem._ops] == ["mean"]
+    assert left._ops[1].indexer == frozendict({"time": classify(0)})
+    assert_equal(right.collect(), ds.mean("lat").isel(time=1))
+
+
+def test_recording_wrapper_is_built_once_per_method_and_keeps_its_docs(ds):
+    """Every proxy binds the same wrapped function for a name, and it still reads as the xarray method."""
+    method = ds.plan.mean
+    assert method.__func__ is ds.plan.isel(time=0).mean.__func__
+    assert method.__doc__ == xr.Dataset.mean.__doc__
+    assert method.__wrapped__ is xr.Dataset.mean
+    assert_equal(method("lat").collect(), ds.mean("lat"))
+
+
+def test_the_bare_accessor_sees_the_base_mutated_in_place(ds):
+    """``ds.plan`` is cached on ``ds``, so it must not memoise: a variable assigned later still shows."""
+    assert ds.plan is ds.plan
+    assert "extra" not in ds.plan.data_vars
+    assert ds.plan.explain() == "plan (0 ops)"
+    ds["extra"] = ds["elevation"] * 2
+    assert "extra" in ds.plan.data_vars
+    assert_equal(ds.plan.collect(), ds)
+    assert ds.plan._plan is None
+
+
+def test_a_data_variable_attribute_is_never_a_cached_method(ds):
+    """``.temperature`` is an instance attribute, not a type one, so it still materialises."""
+    assert_equal(ds.plan.temperature, ds.temperature)
+    assert_equal(ds.plan.isel(time=0).temperature, ds.isel(time=0).temperature)
+
+
 def test_getitem_records_and_computes(ds):
     """``ds.plan["temperature"]`` records a projection and collects to the same DataArray as eager."""
     assert_equal(ds.plan["temperature"].collect(), ds["temperature"])
@@ -251,6 +365,34 @@ def test_sel_merge_equal(ds):
     assert_equal(got, ds.sel(lat=1).sel(lon=2))
 
 
+def test_interleaved_select_fold_equal(ds):
+    """``sel, isel, sel`` on disjoint dims replays, folded, to the same result as the eager chain."""
+    got = ds.plan.sel(lat=1).isel(time=0).sel(lon=slice(1, 3)).collect()
+    assert_equal(got, ds.sel(lat=1).isel(time=0).sel(lon=slice(1, 3)))
+
+
+def test_adjacent_reduce_fold_equal(ds):
+    """``max`` then ``max`` over another dim replays, folded, to the same result as the eager chain."""
+    got = ds.plan.max("lat").max(dim="lon").collect()
+    assert_equal(got, ds.max("lat").max(dim="lon"))
+
+
+def test_interleaved_selects_after_a_restructuring_opaque_are_left(ds):
+    """After ``stack`` repurposes ``lat`` (with ``lon`` a level of it), the triple is not folded against base dims."""
+    stacked = ds.rename(lat="q").stack(lat=("q", "lon"))
+    expected = stacked.sel(time=slice(0, 2)).isel(lat=slice(0, 6)).sel(lon=1)
+    chain = ds.plan.rename(lat="q").stack(lat=("q", "lon"))
+    got = chain.sel(time=slice(0, 2)).isel(lat=slice(0, 6)).sel(lon=1).collect()
+    assert_equal(got, expected)
+
+
+def test_interleaved_selects_around_a_vectorized_indexer_are_left(ds):
+    """A ``DataArray`` indexer mints the dim the last select slices, so the last select may not hop it."""
+    pick = xr.DataArray([0, 1, 2, 3, 0], dims="lon")
+    got = ds.plan.sel(lat=1).isel(time=pick).sel(lon=slice(1, 3)).collect()
+    assert_equal(got, ds.sel(lat=1).isel(time=pick).sel(lon=slice(1, 3)))
+
+
 def test_select_on_reduced_dim_raises(ds):
     """Selecting a dim a preceding ``mean`` already removed raises ``InvalidExpressionError`` at collect time."""
     with pytest.raises(InvalidExpressionError):
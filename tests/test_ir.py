@@ -218,6 +218,16 @@ def test_select_consumes_cannot_drift_from_indexer():
     assert node.consumes == frozenset()
 
 
+def test_select_consumes_is_derived_not_passed():
+    """``consumes`` cannot be passed, and ``replace`` re-derives it from the new indexer."""
+    with pytest.raises(TypeError):
+        Select(name="isel", indexer={"time": 0}, consumes=frozenset())
+    node = dataclasses.replace(
+        Select(name="isel", indexer={"time": 0}), indexer={"lat": 1}
+    )
+    assert node.consumes == frozenset({"lat"})
+
+
 def test_select_name_is_literal_typed():
     """Both valid select names construct; the invalid ones are a type error, not a raise.
 
@@ -237,6 +247,14 @@ def test_variants_are_frozen():
         node.name = "sum"
 
 
+def test_variants_are_slotted():
+    """No node carries an instance ``__dict__``: fields live in slots, one per declared field."""
+    for node in (Reduce(name="mean"), Select(name="isel"), Rechunk(name="chunk")):
+        assert not hasattr(node, "__dict__")
+        with pytest.raises(AttributeError):
+            object.__setattr__(node, "undeclared", 1)
+
+
 def test_metadata_cannot_be_mutated_in_place():
     """Freezing reaches into the containers: neither kwargs nor indexer accepts an item set."""
     node = Select(name="isel", kwargs={"drop": True}, indexer={"time": 0})
@@ -18,6 +18,7 @@ import xarray as xr
 from xrexpr.operations import (
     CONTEXT_METHODS,
     OP_TABLE,
+    SEPARABLE_REDUCTIONS,
     ContextSpec,
     OpSpec,
     ProjectSpec,
@@ -96,6 +97,14 @@ def test_reduce_takes_its_dim_spec_second():
     assert spec("mean").dim_arg == 0
 
 
+def test_only_exactly_regroupable_reductions_are_separable():
+    """The fold-eligible set is derived from the rows, and holds exactly the idempotent four."""
+    assert SEPARABLE_REDUCTIONS == {"all", "any", "max", "min"}
+    assert spec("max").separable
+    assert not spec("sum").separable
+    assert not spec("mean").separable
+
+
 def test_spec_unknown_returns_none():
     """An untabulated name has no spec, which is what routes it to ``Opaque``."""
     assert spec("where") is None
@@ -25,7 +25,12 @@ from xrexpr.chunks import SingleSize
 from xrexpr.exceptions import InvalidExpressionError
 from xrexpr.indexers import classify
 from xrexpr.ir import ALL_DIMS, GroupedReduce, WeightedReduce, WindowedReduce
-from xrexpr.optimize import dim_effect, optimize
+from xrexpr.optimize import (
+    dim_effect,
+    optimize,
+    pushdown_projections,
+    pushdown_selects,
+)
 from xrexpr.schema import SchemaState, to_opnode
 
 
@@ -95,6 +100,42 @@ def test_isel_and_sel_not_merged(schema):
     assert [n.name for n in out] == ["isel", "sel"]
 
 
+def test_interleaved_selects_fold_around_a_disjoint_middle(schema):
+    """``sel, isel, sel`` on disjoint dims folds the two ``sel``s, leaving the ``isel`` after."""
+    plan = [_node("sel", lat=1), _node("isel", time=0), _node("sel", lon=2)]
+    out = optimize(plan, schema)
+    assert [n.name for n in out] == ["sel", "isel"]
+    assert out[0].indexer == _ix(lat=1, lon=2)
+    assert out[0].args == ({"lat": 1, "lon": 2},)
+    assert out[1] == plan[1]
+
+
+def test_interleaved_selects_sharing_a_dim_with_the_middle_are_left(schema):
+    """The trailing select may not hop a middle select on the same dim: order is the meaning there."""
+    plan = [
+        _node("isel", lat=slice(0, 2)),
+        _node("sel", time=1),
+        _node("isel", time=0),
+    ]
+    assert optimize(plan, schema) == plan
+
+
+def test_interleaved_selects_naming_a_non_dim_are_left(schema):
+    """A key that is not a base dim (a ``MultiIndex`` level, say) may share an axis by another name."""
+    plan = [_node("sel", lat=1), _node("isel", time=0), _node("sel", level=2)]
+    assert optimize(plan, schema) == plan
+
+
+def test_interleaved_selects_with_an_option_kwarg_are_left(schema):
+    """A ``drop=True`` middle select is a barrier, as it is to an adjacent merge."""
+    plan = [
+        _node("sel", lat=1),
+        _node("isel", time=0, drop=True),
+        _node("sel", lon=2),
+    ]
+    assert optimize(plan, schema) == plan
+
+
 def test_option_kwarg_select_is_a_barrier(schema):
     """A ``drop=True`` option kwarg can't be carried by a bare indexer, so it blocks the merge."""
     plan = [_node("isel", time=0, drop=True), _node("isel", lat=1)]
@@ -110,6 +151,51 @@ def test_non_select_plan_unchanged(schema):
     assert [n.name for n in out] == ["mean", "mean"]
 
 
+def test_adjacent_max_reduces_fold_into_one_call(schema):
+    """``max("lat").max("lon")`` folds into one ``max`` over both dims, options kept."""
+    plan = [_node("max", "lat", skipna=False), _node("max", dim="lon", skipna=False)]
+    out = optimize(plan, schema)
+    assert [n.name for n in out] == ["max"]
+    assert out[0].args == ()
+    assert out[0].kwargs == {"skipna": False, "dim": ["lat", "lon"]}
+    assert out[0].consumes == frozenset({"lat", "lon"})
+
+
+def test_adjacent_reduces_that_do_not_regroup_exactly_are_left(schema):
+    """``sum``/``mean`` pairs stay two calls: regrouping would move a float or a NaN weight."""
+    for reduce_op in ("sum", "mean"):
+        plan = [_node(reduce_op, "lat"), _node(reduce_op, "lon")]
+        out = optimize(plan, schema)
+        assert [n.name for n in out] == [reduce_op, reduce_op]
+
+
+def test_adjacent_reduces_with_differing_options_or_shared_dims_are_left(schema):
+    """Different ``skipna``, a shared dim, or a bare reduce each keep the pair apart."""
+    for plan in (
+        [_node("max", "lat", skipna=True), _node("max", "lon")],
+        [_node("max", "lat"), _node("max", "lat")],
+        [_node("max"), _node("max", "lon")],
+    ):
+        assert len(optimize(plan, schema)) == 2
+
+
+def test_a_single_node_plan_is_returned_without_a_pass(schema):
+    """A plan too short for any rule comes back as the same list, unchanged."""
+    plan = [_node("mean", "lat")]
+    assert optimize(plan, schema) is plan
+    assert optimize([], schema) == []
+
+
+def test_a_plan_with_nothing_to_rewrite_is_returned_without_a_pass(schema):
+    """Scans and opaque calls alone give no rule anything to move, so the plan comes back as is."""
+    plan = [
+        _node("cumsum", "time"),
+        _node("rename", {"lat": "y"}),
+        _node("diff", "lon"),
+    ]
+    assert optimize(plan, schema) is plan
+
+
 def test_pushdown_isel_past_mean(schema):
     """A disjoint ``isel`` hops in front of a ``mean`` reduce that doesn't touch its dim."""
     plan = [_node("mean", "lat"), _node("isel", time=0)]
@@ -118,6 +204,32 @@ def test_pushdown_isel_past_mean(schema):
     assert out[0].indexer == _ix(time=0)
 
 
+def test_pushdown_walks_a_select_past_a_run_of_nodes_in_one_call(schema):
+    """One firing carries the select to the front, past every node it is disjoint from."""
+    plan = [
+        _node("mean", "lat"),
+        _node("sum", "lon"),
+        _node("cumsum", "lat"),
+        _node("isel", time=0),
+    ]
+    out = pushdown_selects(plan, schema)
+    assert [n.name for n in out] == ["isel", "mean", "sum", "cumsum"]
+
+
+def test_pushdown_walk_stops_at_an_immovable_node_and_raises_at_an_invalid_one(schema):
+    """The walk ends at a scan on the select's dim, and raises at a reduce that removed it."""
+    plan = [_node("cumsum", "time"), _node("mean", "lat"), _node("isel", time=0)]
+    assert [n.name for n in pushdown_selects(plan, schema)] == [
+        "cumsum",
+        "isel",
+        "mean",
+    ]
+    with pytest.raises(InvalidExpressionError):
+        pushdown_selects(
+            [_node("mean", "time"), _node("sum", "lat"), _node("isel", time=0)], schema
+        )
+
+
 def test_pushdown_generalises_to_sum(schema):
     """Select pushdown generalises beyond ``mean``: a disjoint ``isel`` also hops past a ``sum`` reduce."""
     plan = [_node("sum", "lat"), _node("isel", time=0)]
@@ -365,6 +477,24 @@ def test_pushdown_projection_past_reduce(schema):
     assert out[0].variables == ("temperature",)
 
 
+def test_pushdown_walks_a_projection_to_the_front_in_one_call(schema):
+    """One firing carries the projection past every node it may cross, on one schema fold."""
+    plan = [
+        _node("mean", "time"),
+        _node("isel", lat=0),
+        _node("__getitem__", ["elevation"]),
+    ]
+    out = pushdown_projections(plan, schema)
+    assert [n.name for n in out] == ["mean", "__getitem__", "isel"]
+    plan = [
+        _node("mean", "lat"),
+        _node("isel", time=0),
+        _node("__getitem__", ["temperature"]),
+    ]
+    out = pushdown_projections(plan, schema)
+    assert [n.name for n in out] == ["__getitem__", "mean", "isel"]
+
+
 def test_pushdown_projection_past_bare_reduce(schema):
     """A projection may lead a bare ``mean()`` when the variable spans every dim the reduce would resolve.
 